@@ -3,16 +3,143 @@
 import os
 import sys
 import time
+import select
+import selectors
+import errno
+import json
+import struct
+import hashlib
+import ctypes
+import signal
+import traceback
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import argparse
 import importlib
-import inspect
+import importlib.util
 import uvicorn
 
 # Environment variable to distinguish parent vs child
 _CHILD_ENV_VAR = "ANACOSTIA_RELOADER_CHILD"
 
+# Environment variable carrying the app module's resolved file from the
+# reloader to the child, as JSON {"name": ..., "file": ...}
+_APP_SPEC_ENV_VAR = "ANACOSTIA_APP_SPEC"
+
+# inotify(7) constants, see <sys/inotify.h>
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_Q_OVERFLOW = 0x00004000
+_IN_IGNORED = 0x00008000
+_IN_ISDIR = 0x40000000
+_IN_CLOEXEC = 0o2000000
+_IN_NONBLOCK = 0o4000
+
+# Only the events that can mean "a .py file changed"; never IN_ALL_EVENTS.
+_WATCH_MASK = _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+
+# struct inotify_event { int wd; uint32_t mask, cookie, len; char name[]; }
+_EVENT_HEADER = struct.Struct("iIII")
+_EVENT_MAX_SIZE = _EVENT_HEADER.size + 256  # NAME_MAX + 1
+_EVENT_BUF_SIZE = 64 * 1024
+
+# statx(2) constants, see <linux/stat.h>
+_AT_FDCWD = -100
+_AT_STATX_DONT_SYNC = 0x4000
+_STATX_MASK = 0x40 | 0x100 | 0x200  # STATX_MTIME | STATX_INO | STATX_SIZE
+_STATX_BUF_SIZE = 256
+
+# stx_ino and stx_size at offset 32, stx_mtime.{tv_sec,tv_nsec} at offset 112
+_STATX_FIELDS = struct.Struct("<32xQQ64xqI")
+
+_NS_PER_SEC = 1_000_000_000
+
+# Source files are matched by a literal suffix test, never a glob; inotify
+# names are checked as raw bytes before being decoded
+_PY_SUFFIX = ".py"
+_PY_SUFFIX_BYTES = b".py"
+
+# Directories never worth watching: caches, VCS metadata, virtualenvs and
+# vendored JS, which can hold orders of magnitude more files than the app
+_IGNORED_DIRS = frozenset({
+    "__pycache__",
+    ".git",
+    ".hg",
+    ".venv",
+    "venv",
+    "virtualenv",
+    "node_modules",
+    ".mypy_cache",
+    ".pytest_cache",
+    ".ruff_cache",
+    ".tox",
+    ".nox",
+})
+
+# Any directory holding this file is a virtualenv, whatever it's called
+_VENV_MARKER = "pyvenv.cfg"
+
+# Trees with more directories than this are walked from a thread pool;
+# scandir() releases the GIL, so the syscalls overlap across cores
+_PARALLEL_WALK_MIN_DIRS = 1000
+_PARALLEL_WALK_WORKERS = min(8, os.cpu_count() or 1)
+
+# Quiet period to wait for after a change before restarting, so a burst of
+# writes (git checkout, editor save-all) causes a single reload
+_DEBOUNCE_SECONDS = 0.2
+
+
+def _import_app_module(module_name: str):
+    """
+    Import `module_name`. If the reloader already resolved it to a file,
+    load that file directly instead of searching sys.path for it again.
+    """
+    app_spec = os.environ.get(_APP_SPEC_ENV_VAR)
+    if not app_spec:
+        return importlib.import_module(module_name)
+    app_spec = json.loads(app_spec)
+    module_file = app_spec["file"]
+    if app_spec["name"] != module_name or not os.path.isfile(module_file):
+        # Stale hand-off (e.g. the file was renamed); let the normal import
+        # machinery find it or raise a clean ImportError
+        return importlib.import_module(module_name)
+
+    # Packages must be initialised before their submodules, exactly as a
+    # regular import would; the parent may even import this module itself
+    parent_name, _, child_name = module_name.rpartition(".")
+    parent = importlib.import_module(parent_name) if parent_name else None
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    search_locations = None
+    if os.path.basename(module_file) == "__init__.py":
+        search_locations = [os.path.dirname(module_file)]
+    spec = importlib.util.spec_from_file_location(
+        module_name, module_file, submodule_search_locations=search_locations
+    )
+    if spec is None:
+        return importlib.import_module(module_name)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except FileNotFoundError as exc:
+        sys.modules.pop(module_name, None)
+        if exc.filename != module_file:
+            raise
+        # Removed between the isfile() check and loading it
+        raise ImportError(f"No module named '{module_name}'", name=module_name) from exc
+    except BaseException:
+        sys.modules.pop(module_name, None)
+        raise
+    if parent is not None:
+        setattr(parent, child_name, module)
+    return module
+
 
 def _run_app(app_path: str, host: str = "127.0.0.1", port: int = 8000):
     """
@@ -29,7 +156,7 @@ def _run_app(app_path: str, host: str = "127.0.0.1", port: int = 8000):
         )
 
     try:
-        module = importlib.import_module(module_name)
+        module = _import_app_module(module_name)
     except ImportError as exc:
         raise SystemExit(f"Could not import module '{module_name}' for --app: {exc}") from exc
 
@@ -54,30 +181,574 @@ def _run_app(app_path: str, host: str = "127.0.0.1", port: int = 8000):
     )
 
 
-def _iter_python_files(root: Path):
-    """Yield all .py files under the given root directory."""
-    for path in root.rglob("*.py"):
-        yield path
+def _is_ignored_dir(path: str) -> bool:
+    """Return True for directories the reloader never descends into."""
+    return os.path.basename(path) in _IGNORED_DIRS or os.path.exists(os.path.join(path, _VENV_MARKER))
+
+
+def _scan_dir(top: str):
+    """
+    List `top` with a single scandir() and return `(subdirs, files)`: a dict
+    mapping each subdirectory to its mtime, and the .py files directly in it.
+    All paths are plain strings; no pathlib objects are built per entry.
+    """
+    subdirs = {}
+    files = []
+    with os.scandir(top) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                if _is_ignored_dir(entry.path):
+                    continue
+                subdirs[entry.path] = entry.stat(follow_symlinks=False).st_mtime_ns
+            elif entry.name.endswith(_PY_SUFFIX):
+                files.append(entry.path)
+    return subdirs, files
+
+
+def _try_scan_dir(top: str):
+    try:
+        return _scan_dir(top)
+    except OSError:
+        # Directory vanished mid-walk; its parent's mtime will have changed
+        return {}, []
+
+
+def _discover_tree(root: str):
+    """
+    Walk `root` and return a dict mapping it and every directory below it
+    to `(mtime_ns, files, subdirs)`, where `files` are the .py files
+    directly in that directory.
+
+    The walk goes one directory level at a time. Once more than
+    `_PARALLEL_WALK_MIN_DIRS` directories have been found, the remaining
+    levels are scanned from a thread pool, so only genuinely large trees
+    pay for starting one.
+    """
+    mtimes = {root: _stat_key(root)[0]}
+    tree = {}
+    frontier = [root]
+    pool = None
+    try:
+        while frontier:
+            if pool is None and len(mtimes) > _PARALLEL_WALK_MIN_DIRS:
+                pool = ThreadPoolExecutor(max_workers=_PARALLEL_WALK_WORKERS)
+            scan = pool.map if pool is not None else map
+            next_frontier = []
+            for top, (subdirs, files) in zip(frontier, scan(_try_scan_dir, frontier)):
+                tree[top] = (mtimes[top], files, list(subdirs))
+                mtimes.update(subdirs)
+                next_frontier.extend(subdirs)
+            frontier = next_frontier
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return tree
+
+
+def _tree_files(tree):
+    """Return every .py file in a tree from `_discover_tree`."""
+    return [path for _, files, _ in tree.values() for path in files]
+
+
+def _load_statx():
+    """Return libc's statx() (glibc >= 2.28), or None if it isn't available."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        statx = ctypes.CDLL(None, use_errno=True).statx
+    except (OSError, AttributeError):
+        return None
+    statx.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_uint, ctypes.c_void_p]
+    statx.restype = ctypes.c_int
+    return statx
+
+
+_statx = _load_statx()
+
+
+def _stat_key(path: str):
+    """
+    Return `(st_mtime_ns, st_size, st_ino)` for `path`, raising OSError like
+    os.stat() does.
+
+    On Linux this uses statx(2) with AT_STATX_DONT_SYNC, which lets network
+    filesystems (NFS, SMB) answer from cached attributes instead of making a
+    server round-trip per file; on local disks it's the same as stat().
+    If the kernel or a seccomp filter refuses statx (ENOSYS, EPERM), it is
+    disabled for good and os.stat() is used from then on.
+    """
+    global _statx
+    if _statx is not None:
+        buf = ctypes.create_string_buffer(_STATX_BUF_SIZE)
+        if _statx(_AT_FDCWD, os.fsencode(path), _AT_STATX_DONT_SYNC, _STATX_MASK, buf) == 0:
+            ino, size, sec, nsec = _STATX_FIELDS.unpack_from(buf)
+            return (sec * _NS_PER_SEC + nsec, size, ino)
+        err = ctypes.get_errno()
+        if err not in (errno.ENOSYS, errno.EPERM):
+            raise OSError(err, os.strerror(err), path)
+        _statx = None
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _has_coarse_mtimes(root: str, files) -> bool:
+    """
+    Guess whether the filesystem under `root` only keeps whole-second mtimes
+    (HFS+, SMB, FAT). A single sub-second mtime proves it doesn't, so on
+    fine-grained filesystems this usually stops after the first stat.
+    """
+    for path in (root, *files):
+        try:
+            if _stat_key(path)[0] % _NS_PER_SEC:
+                return False
+        except OSError:
+            continue
+    return True
+
+
+def _snapshot(files) -> frozenset:
+    """
+    Return a frozenset of `(path, change_key)` pairs for the given files.
+    The symmetric difference of two snapshots is exactly the set of files
+    added, removed or modified in between.
+
+    The change key is (st_mtime_ns, st_size, st_ino): nanosecond mtimes catch
+    rapid successive edits, and the inode catches atomic rename-into-place
+    saves that keep the old mtime.
+    """
+    entries = []
+    for path in files:
+        try:
+            entries.append((path, _stat_key(path)))
+        except OSError:
+            continue
+    return frozenset(entries)
+
+
+def _content_hash(path: str):
+    """Return a short hash of the file's contents, or None if it can't be read."""
+    try:
+        with open(path, "rb") as f:
+            return hashlib.blake2b(f.read(), digest_size=8).digest()
+    except OSError:
+        return None
+
+
+class _MtimePoller:
+    """
+    Polling fallback for platforms without inotify.
+
+    The directory tree is cached along with each directory's mtime and the
+    .py files in it. A directory's mtime changes iff entries were added or
+    removed, so each tick stats the known directories and re-lists only the
+    ones that changed; unchanged directories reuse their cached file lists.
+    """
+
+    def __init__(self, root: Path):
+        self._root = str(root)
+        self._tree = _discover_tree(self._root)
+        self._files = _tree_files(self._tree)
+        self._coarse = _has_coarse_mtimes(self._root, self._files)
+        self._snapshot = _snapshot(self._files)
+        self._hashes = {}
+        if self._coarse:
+            self._recheck_recent(self._snapshot)
+
+    def _drop(self, top: str):
+        """Forget `top` and every directory below it."""
+        stack = [top]
+        while stack:
+            entry = self._tree.pop(stack.pop(), None)
+            if entry is not None:
+                stack.extend(entry[2])
+
+    def _rescan(self, top: str):
+        """Re-list a directory whose mtime changed, picking up new and removed subdirectories."""
+        _, _, old_subdirs = self._tree.pop(top)
+        try:
+            mtime = _stat_key(top)[0]
+            subdirs, files = _scan_dir(top)
+        except OSError:
+            # Gone; its parent's mtime changed too and will drop it as well
+            for subdir in old_subdirs:
+                self._drop(subdir)
+            return
+
+        self._tree[top] = (mtime, files, list(subdirs))
+        for subdir in set(old_subdirs) - subdirs.keys():
+            self._drop(subdir)
+        for subdir in subdirs.keys() - set(old_subdirs):
+            try:
+                self._tree.update(_discover_tree(subdir))
+            except OSError:
+                # Removed again since we listed `top`; its mtime will have
+                # moved, so the next tick re-lists it
+                continue
+
+    def _recheck_recent(self, snapshot):
+        """
+        On a coarse-mtime filesystem, a second save within the same second
+        leaves the change key untouched. Hash the few files saved within the
+        last couple of seconds and return those whose contents changed while
+        their key did not. Hashes are only compared for an unchanged key, so
+        a file ageing out of the window is never reported.
+        """
+        changed = set()
+        hashes = {}
+        now_ns = time.time_ns()
+        for path, key in snapshot:
+            if now_ns - key[0] >= 2 * _NS_PER_SEC:
+                continue
+            digest = _content_hash(path)
+            if digest is None:
+                continue
+            previous = self._hashes.get(path)
+            if previous is not None and previous[0] == key and previous[1] != digest:
+                changed.add(path)
+            hashes[path] = (key, digest)
+        self._hashes = hashes
+        return changed
+
+    def changed(self):
+        """Return the set of .py files added, removed or modified since the last call."""
+        stale = []
+        for path, (mtime, _, _) in self._tree.items():
+            try:
+                if _stat_key(path)[0] != mtime:
+                    stale.append(path)
+            except OSError:
+                stale.append(path)
+        if stale:
+            for path in stale:
+                # An earlier rescan may already have dropped it with its parent
+                if path in self._tree:
+                    self._rescan(path)
+            self._files = _tree_files(self._tree)
+
+        snapshot = _snapshot(self._files)
+        changed = {path for path, _ in snapshot ^ self._snapshot}
+        if self._coarse:
+            changed |= self._recheck_recent(snapshot)
+        self._snapshot = snapshot
+        return changed
+
+
+class _Inotify:
+    """
+    Minimal ctypes wrapper around Linux inotify(7).
+
+    One watch descriptor is added per directory under `root`; new
+    subdirectories are picked up as they are created or moved in, and
+    dropped when they are moved out.
+    """
+
+    def __init__(self, libc, root: Path):
+        self._libc = libc
+        self.fd = libc.inotify_init1(_IN_CLOEXEC | _IN_NONBLOCK)
+        if self.fd < 0:
+            err = ctypes.get_errno()
+            raise OSError(err, os.strerror(err))
+        self._poller = select.poll()
+        self._poller.register(self.fd, select.POLLIN)
+        self._root = str(root)
+        self._dirs = {}
+        try:
+            # A partial watch at startup would silently miss changes, so
+            # let the caller fall back to polling instead
+            self._add_tree(self._root, strict=True)
+        except OSError:
+            os.close(self.fd)
+            raise
+
+    def _add_tree(self, top: str, strict: bool = False):
+        """
+        Watch `top` and every directory below it, returning the .py files
+        already in them: a directory that arrives populated (mkdir -p then
+        write, mv, cp -r, checkout) generates no events for its contents.
+
+        `top` itself is always watched; the ignore list only prunes what is
+        below it, so an app directory that is itself a venv still works.
+        """
+        files = []
+        stack = [top]
+        while stack:
+            dirpath = stack.pop()
+            # Watch before listing: anything created after the listing then
+            # still produces an event, so nothing can fall into the gap
+            wd = self._libc.inotify_add_watch(self.fd, os.fsencode(dirpath), _WATCH_MASK)
+            if wd < 0:
+                err = ctypes.get_errno()
+                if strict:
+                    raise OSError(err, os.strerror(err), dirpath)
+                if err != errno.ENOENT:
+                    print(f"Cannot watch {dirpath} ({os.strerror(err)}); changes under it will be missed.")
+                continue
+            self._dirs[wd] = dirpath
+            try:
+                with os.scandir(dirpath) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not _is_ignored_dir(entry.path):
+                                stack.append(entry.path)
+                        elif entry.name.endswith(_PY_SUFFIX):
+                            files.append(entry.path)
+            except OSError:
+                # Vanished after we watched it; IN_IGNORED will clean up
+                continue
+        return files
+
+    def _remove_tree(self, top: str):
+        """Stop watching `top` and everything below it (it was moved away)."""
+        prefix = top + os.sep
+        for wd, dirpath in list(self._dirs.items()):
+            if dirpath == top or dirpath.startswith(prefix):
+                del self._dirs[wd]
+                self._libc.inotify_rm_watch(self.fd, wd)
+
+    def read(self, timeout: int):
+        """
+        Block for up to `timeout` milliseconds and return the .py files
+        touched by any events that arrived. A directory moved out of the
+        tree is reported by its own path, since its modules are gone. On
+        event queue overflow we can no longer tell what changed, so every
+        .py file under the root is reported.
+
+        With `timeout=0` (the caller already knows the fd is readable) this
+        costs a single read(2) per wakeup: the fd is non-blocking, and we
+        only read again when the buffer came back too full to be sure the
+        queue is drained.
+        """
+        if timeout and not self._poller.poll(timeout):
+            return []
+
+        paths = []
+        while True:
+            try:
+                buf = os.read(self.fd, _EVENT_BUF_SIZE)
+            except BlockingIOError:
+                break
+            self._parse(buf, paths)
+            if len(buf) <= _EVENT_BUF_SIZE - _EVENT_MAX_SIZE:
+                break
+        return paths
+
+    def _parse(self, buf: bytes, paths):
+        offset = 0
+        while offset < len(buf):
+            wd, mask, _, length = _EVENT_HEADER.unpack_from(buf, offset)
+            offset += _EVENT_HEADER.size
+            name = buf[offset:offset + length].rstrip(b"\0")
+            offset += length
+
+            if mask & _IN_Q_OVERFLOW:
+                # Events were dropped, possibly including new directories:
+                # re-sync watches over the whole tree (re-adding an existing
+                # watch just returns its wd) and report every .py file
+                paths.extend(self._add_tree(self._root))
+                continue
+            if mask & _IN_IGNORED:
+                self._dirs.pop(wd, None)
+                continue
+
+            dirpath = self._dirs.get(wd)
+            if dirpath is None:
+                continue
+            if mask & _IN_ISDIR:
+                path = os.path.join(dirpath, os.fsdecode(name))
+                if mask & (_IN_CREATE | _IN_MOVED_TO):
+                    if not _is_ignored_dir(path):
+                        paths.extend(self._add_tree(path))
+                elif mask & _IN_MOVED_FROM and any(d == path for d in self._dirs.values()):
+                    self._remove_tree(path)
+                    paths.append(path)
+            elif name.endswith(_PY_SUFFIX_BYTES):
+                paths.append(os.path.join(dirpath, os.fsdecode(name)))
+
+    def close(self):
+        os.close(self.fd)
+
+
+def _watch(root: Path):
+    """
+    Return an inotify watcher for `root`, or None if inotify is unavailable
+    (non-Linux platforms), in which case the caller falls back to polling.
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(None, use_errno=True)
+        libc.inotify_init1
+    except (OSError, AttributeError):
+        return None
+    try:
+        return _Inotify(libc, root)
+    except OSError as exc:
+        print(f"inotify unavailable ({exc}); falling back to polling.")
+        return None
+
+
+def _wait_for_quiet(watcher, poller):
+    """Block until no .py file has changed for `_DEBOUNCE_SECONDS`."""
+    if watcher is not None:
+        deadline = time.monotonic() + _DEBOUNCE_SECONDS
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if watcher.read(timeout=int(remaining * 1000)):
+                deadline = time.monotonic() + _DEBOUNCE_SECONDS
+    else:
+        time.sleep(_DEBOUNCE_SECONDS)
+        while poller.changed():
+            time.sleep(_DEBOUNCE_SECONDS)
+
+
+def _pidfd_open(pid: int):
+    """
+    Return a pidfd that becomes readable when `pid` exits, or None where
+    pidfd_open(2) is unavailable (non-Linux, Linux < 5.3).
+    """
+    try:
+        return os.pidfd_open(pid)
+    except (AttributeError, OSError):
+        return None
+
+
+class _ForkedProcess:
+    """
+    Handle on a forked child exposing the subset of the `subprocess.Popen`
+    interface the reloader uses.
+    """
+
+    def __init__(self, pid: int):
+        self.pid = pid
+        self.args = f"<fork {pid}>"
+        self.returncode = None
+
+    def poll(self):
+        if self.returncode is None:
+            pid, status = os.waitpid(self.pid, os.WNOHANG)
+            if pid:
+                self.returncode = os.waitstatus_to_exitcode(status)
+        return self.returncode
+
+    def wait(self, timeout=None):
+        if timeout is None:
+            if self.returncode is None:
+                _, status = os.waitpid(self.pid, 0)
+                self.returncode = os.waitstatus_to_exitcode(status)
+            return self.returncode
+
+        # Same backoff as Popen.wait(timeout=...)
+        deadline = time.monotonic() + timeout
+        delay = 0.0005
+        while self.poll() is None:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise subprocess.TimeoutExpired(self.args, timeout)
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 0.05)
+        return self.returncode
+
+    def send_signal(self, sig):
+        if self.returncode is None:
+            os.kill(self.pid, sig)
+
+    def terminate(self):
+        self.send_signal(signal.SIGTERM)
+
+    def kill(self):
+        self.send_signal(signal.SIGKILL)
+
+
+def _forget_modules(root: Path):
+    """Drop modules imported from under `root` so they are imported afresh."""
+    prefix = str(root) + os.sep
+    for name, module in list(sys.modules.items()):
+        module_file = getattr(module, "__file__", None)
+        if module_file and os.path.abspath(module_file).startswith(prefix):
+            del sys.modules[name]
+    importlib.invalidate_caches()
+
+
+def _fork_child(args, package_root: Path, watcher):
+    """
+    Fork a child that runs the app in-process.
 
+    The parent has already paid for interpreter startup and for importing
+    uvicorn, so the child starts warm; only the user's code is (re)imported.
+    """
+    pid = os.fork()
+    if pid:
+        return _ForkedProcess(pid)
+
+    # Child: never return into the reloader loop
+    exit_code = 1
+    try:
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        if watcher is not None:
+            watcher.close()
+        os.environ[_CHILD_ENV_VAR] = "1"
+        _forget_modules(package_root)
+        _run_app(app_path=args.app, host=args.host, port=args.port)
+        exit_code = 0
+    except SystemExit as exc:
+        if isinstance(exc.code, int):
+            exit_code = exc.code
+        elif exc.code is None:
+            exit_code = 0
+        else:
+            print(exc.code, file=sys.stderr)
+    except KeyboardInterrupt:
+        exit_code = 0
+    except BaseException:
+        traceback.print_exc()
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(exit_code)
+
+
+def _child_command(args):
+    """Return the `(cmd, env)` used to spawn the child as a fresh interpreter."""
+    env = os.environ.copy()
+    env[_CHILD_ENV_VAR] = "1"  # mark as child
+
+    # Build the command for the child.
+    # We pass --app through so the child knows which app to run.
+    cmd = [sys.executable, "-m", "anacostia", "--app", args.app]
+    if args.host:
+        cmd += ["--host", args.host]
+    if args.port:
+        cmd += ["--port", str(args.port)]
+    return cmd, env
 
-def _snapshot_mtimes(root: Path):
-    """Return a dict mapping file -> mtime for all .py files."""
-    return {path: path.stat().st_mtime for path in _iter_python_files(root)}
 
+def _spawn_child(cmd, env):
+    """Start the child as a fresh interpreter, for platforms without fork()."""
+    print("Starting child process...", " ".join(cmd))
+    return subprocess.Popen(cmd, env=env)
 
-def _resolve_app_directory(app_path: str) -> Path:
+
+def _resolve_app_file(app_path: str) -> Path:
     # add current dir to sys.path to allow local imports
     repo_dir = Path.cwd()
     if repo_dir.is_dir():
         sys.path.insert(0, str(repo_dir))
 
-    # Import the module part of the app path
+    # Locate (but don't execute) the module part of the app path; the
+    # parent only watches files, so it never needs the app's import graph
     module_name, _ = app_path.split(":", 1)
-    module = importlib.import_module(module_name)
+    try:
+        spec = importlib.util.find_spec(module_name)
+    except (ImportError, ValueError) as exc:
+        raise SystemExit(f"Could not find module '{module_name}' for --app: {exc}") from exc
+    if spec is None:
+        raise SystemExit(f"Could not find module '{module_name}' for --app '{app_path}'.")
+    if spec.origin is None or not spec.has_location:
+        raise SystemExit(f"Could not find a source file for module '{module_name}' (from --app '{app_path}').")
 
-    # Inspect the file the module came from and return its parent directory
-    module_file = inspect.getfile(module)
-    return Path(module_file).resolve().parent
+    return Path(spec.origin).resolve()
 
 
 def _run_with_reloader(args):
@@ -85,64 +756,97 @@ def _run_with_reloader(args):
     Parent process: spawn child that runs the app,
     watch for file changes, restart child on change.
     """
-    package_root = _resolve_app_directory(args.app)
+    app_file = _resolve_app_file(args.app)
+    package_root = app_file.parent
     print(f"Watching for changes under: {package_root}")
 
-    # Initial snapshot of file mtimes
-    mtimes = _snapshot_mtimes(package_root)
+    # Hand the resolved module file down to every child (forked or spawned)
+    # so it can load it directly instead of repeating the sys.path search
+    module_name, _ = args.app.split(":", 1)
+    os.environ[_APP_SPEC_ENV_VAR] = json.dumps({"name": module_name, "file": str(app_file)})
 
-    child_args = []
-    if args.host:
-        child_args += ["--host", args.host]
-    if args.port:
-        child_args += ["--port", str(args.port)]
+    # Prefer kernel change notifications; poll mtimes only as a fallback
+    watcher = _watch(package_root)
+    poller = _MtimePoller(package_root) if watcher is None else None
 
-    while True:
-        # Spawn child process
-        env = os.environ.copy()
-        env[_CHILD_ENV_VAR] = "1"  # mark as child
+    # Without fork() every restart spawns the same command line with the
+    # same environment, so build them once up front
+    spawn = None if hasattr(os, "fork") else _child_command(args)
+
+    # Treat SIGTERM like Ctrl-C so `kill <reloader>` stops the child right
+    # away instead of leaving it orphaned.
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    try:
+        return _reload_loop(args, package_root, watcher, poller, spawn)
+    finally:
+        if watcher is not None:
+            watcher.close()
 
-        # Build the command for the child.
-        # We pass --app through so the child knows which app to run.
-        cmd = [sys.executable, "-m", "anacostia", "--app", args.app, *child_args]
-        if args.no_reload:
-            # Shouldn't happen because we're only here if reload=True,
-            # but we keep args around for completeness.
-            pass
 
-        print("Starting child process...", " ".join(cmd))
-        proc = subprocess.Popen(cmd, env=env)
+def _reload_loop(args, package_root, watcher, poller, spawn):
+    """Spawn the child and restart it whenever a .py file changes."""
+    while True:
+        if spawn is None:
+            print("Starting child process (fork)...")
+            proc = _fork_child(args, package_root, watcher)
+        else:
+            proc = _spawn_child(*spawn)
+
+        # Block on the child's pidfd and the inotify fd together so we wake
+        # only when the child exits or a file changes. Without either, fall
+        # back to checking once a second.
+        pidfd = _pidfd_open(proc.pid)
+        selector = selectors.DefaultSelector()
+        if pidfd is not None:
+            selector.register(pidfd, selectors.EVENT_READ)
+        if watcher is not None:
+            selector.register(watcher.fd, selectors.EVENT_READ)
+        timeout = None if pidfd is not None and watcher is not None else 1.0
 
         try:
             while True:
+                if selector.get_map():
+                    selector.select(timeout=timeout)
+                else:
+                    time.sleep(timeout)
+
                 # Has the child exited?
                 return_code = proc.poll()
                 if return_code is not None:
                     print(f"Child exited with code {return_code}.")
                     return return_code
 
-                time.sleep(1.0)
-
                 # Check for file changes
-                new_mtimes = _snapshot_mtimes(package_root)
-                if new_mtimes != mtimes:
+                if watcher is not None:
+                    changed = watcher.read(timeout=0)
+                else:
+                    changed = poller.changed()
+
+                if changed:
+                    _wait_for_quiet(watcher, poller)
                     print("Detected file change. Reloading...")
-                    mtimes = new_mtimes
                     # Kill child and break to restart
                     proc.terminate()
                     try:
                         proc.wait(timeout=5)
                     except subprocess.TimeoutExpired:
                         proc.kill()
+                        proc.wait()
                     break  # restart loop (new child)
         except KeyboardInterrupt:
-            print("Reloader got KeyboardInterrupt, shutting down.")
+            print("Reloader interrupted, shutting down.")
             proc.terminate()
             try:
                 proc.wait(timeout=5)
             except subprocess.TimeoutExpired:
                 proc.kill()
+                proc.wait()
             return 0
+        finally:
+            selector.close()
+            if pidfd is not None:
+                os.close(pidfd)
 
 
 def main():